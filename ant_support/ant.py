@@ -9,7 +9,9 @@ compatibility with the original serial-based implementation.
 import sys
 import time
 import threading
-from functools import reduce
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
 
 from openant.easy.node import Node
 from openant.easy.channel import Channel
@@ -45,9 +47,10 @@ ANT_Enable_Ext_Msgs = 0x66
 ANT_Lib_Config = 0x6E
 ANTRCT_Set_RSSI_Threshold = 0xC4
 
-ant_ids = {}
-for ant_message in [x for x in dir() if x.startswith('ANT')]:
-    ant_ids[eval(ant_message)] = ant_message
+ant_ids = MappingProxyType({value: name for name, value in globals().items() if name.startswith('ANT')})
+
+# Number of most recent RSSI samples kept when RSSI logging is enabled
+RSSI_LOG_SIZE = 4096
 
 
 # Exception classes (kept for backward compatibility)
@@ -87,8 +90,21 @@ class AntChecksumException(AntException):
     pass
 
 
+# Sport messages that match almost any broadcast, so they must be tried last
+_OFFENDING_MESSAGES = ('heart_rate', 'speed', 'cadence', 'speed_cadence')
+
+
+def _as_int_list(data):
+    """Return payload data as a list of integers (openant expects list, not bytes)."""
+    # Lists pass through untouched; bytes/bytearray/memoryview buffers are copied once
+    if isinstance(data, list):
+        return data
+    return list(data)
+
+
+@lru_cache(maxsize=1)
 def load_ant_messages():
-    """Load ANT message definitions for message parsing."""
+    """Load ANT message definitions for message parsing (built once, then cached)."""
     from . import ant_messages
     try:
         from . import quarq_messages
@@ -102,10 +118,9 @@ def load_ant_messages():
         messages += quarq_messages.messages
     messages += ant_messages.messages
 
-    offending_messages = ['heart_rate', 'speed', 'cadence', 'speed_cadence']
-    for m in offending_messages:
-        messages.messages_keys.remove(m)
-        messages.messages_keys.append(m)
+    # Move the catch-all sport messages to the end so they are matched last
+    messages.messages_keys = ([k for k in messages.messages_keys if k not in _OFFENDING_MESSAGES] +
+                              list(_OFFENDING_MESSAGES))
 
     return messages
 
@@ -122,16 +137,17 @@ class Ant:
         self.quiet = quiet
         self.silent = silent
         self.messages = load_ant_messages()
-        self.t0 = time.time()
+        self.t0 = time.monotonic()
 
         self._node = None
         self._channels = {}
+        self._send_broadcast = {}  # channel -> bound send_broadcast_data of its openant channel
         self._network_keys = {}
         self._running = False
         self._node_thread = None
 
         # Legacy compatibility attributes
-        self.rssi_log = {}
+        self.rssi_log = deque(maxlen=RSSI_LOG_SIZE)  # (timestamp, channel, rssi) samples
         self.rssi_logging = False
 
         # Simulated serial port attributes for compatibility
@@ -139,6 +155,8 @@ class Ant:
 
     class _SerialPortCompat:
         """Compatibility shim for code that accesses self.sp directly."""
+        __slots__ = ('_parent', 'timeout', 'baudrate')
+
         def __init__(self, parent):
             self._parent = parent
             self.timeout = 30
@@ -147,21 +165,20 @@ class Ant:
         def setTimeout(self, t):
             self.timeout = t
 
-        def flushInput(self):
-            pass
-
-        def flushOutput(self):
-            pass
-
-        def flush(self):
+        def _noop(self):
             pass
 
-        def inWaiting(self):
+        def _zero(self):
             return 0
 
-        def getCTS(self):
+        def _true(self):
             return True
 
+        # All no-op methods share one function object
+        flushInput = flushOutput = flush = _noop
+        inWaiting = _zero
+        getCTS = _true
+
     def auto_init(self):
         """Initialize the ANT+ USB device automatically."""
         if self._node is not None:
@@ -173,9 +190,6 @@ class Ant:
             self._node_thread.start()
             self._running = True
 
-            # Give the node time to initialize
-            time.sleep(0.5)
-
             if not self.quiet:
                 print("ANT+ USB device initialized via openant")
         except Exception as e:
@@ -200,18 +214,21 @@ class Ant:
         try:
             ant_channel = self._node.new_channel(channel_type, network)
             self._channels[channel] = ant_channel
-
-            if not self.quiet:
-                print(f"Assigned channel {channel} as type {type} on network {network}")
+            self._send_broadcast[channel] = ant_channel.send_broadcast_data
         except Exception as e:
             raise AntWrongResponseException(f"Failed to assign channel: {e}")
 
+        if not self.quiet:
+            print(f"Assigned channel {channel} as type {type} on network {network}")
+
     def unassign_channel(self, channel):
         """Unassign an ANT channel."""
-        if channel in self._channels:
+        ant_channel = self._channels.get(channel)
+        if ant_channel is not None:
             try:
-                self._node.remove_channel(self._channels[channel])
+                self._node.remove_channel(ant_channel)
                 del self._channels[channel]
+                del self._send_broadcast[channel]
             except Exception as e:
                 raise AntWrongResponseException(f"Failed to unassign channel: {e}")
 
@@ -227,64 +244,68 @@ class Ant:
         try:
             self._node.set_network_key(network, key)
             self._network_keys[network] = key
-
-            if not self.quiet:
-                print(f"Set network key for network {network}")
         except Exception as e:
             raise AntWrongResponseException(f"Failed to set network key: {e}")
 
+        if not self.quiet:
+            print(f"Set network key for network {network}")
+
     def set_channel_id(self, channel, device, device_type_id, man_id):
         """Set the channel ID (device number, type, and transmission type)."""
-        if channel not in self._channels:
+        ant_channel = self._channels.get(channel)
+        if ant_channel is None:
             raise AntWrongResponseException(f"Channel {channel} not assigned")
 
         try:
-            self._channels[channel].set_id(device, device_type_id, man_id)
-
-            if not self.quiet:
-                print(f"Set channel {channel} ID: device={device}, type={device_type_id}, man={man_id}")
+            ant_channel.set_id(device, device_type_id, man_id)
         except Exception as e:
             raise AntWrongResponseException(f"Failed to set channel ID: {e}")
 
+        if not self.quiet:
+            print(f"Set channel {channel} ID: device={device}, type={device_type_id}, man={man_id}")
+
     def set_channel_period(self, channel, period):
         """Set the channel message period."""
-        if channel not in self._channels:
+        ant_channel = self._channels.get(channel)
+        if ant_channel is None:
             raise AntWrongResponseException(f"Channel {channel} not assigned")
 
         try:
-            self._channels[channel].set_period(period)
-
-            if not self.quiet:
-                print(f"Set channel {channel} period: {period}")
+            ant_channel.set_period(period)
         except Exception as e:
             raise AntWrongResponseException(f"Failed to set channel period: {e}")
 
+        if not self.quiet:
+            print(f"Set channel {channel} period: {period}")
+
     def set_channel_freq(self, channel, freq):
         """Set the channel RF frequency."""
-        if channel not in self._channels:
+        ant_channel = self._channels.get(channel)
+        if ant_channel is None:
             raise AntWrongResponseException(f"Channel {channel} not assigned")
 
         try:
-            self._channels[channel].set_rf_freq(freq)
-
-            if not self.quiet:
-                print(f"Set channel {channel} frequency: {freq}")
+            ant_channel.set_rf_freq(freq)
         except Exception as e:
             raise AntWrongResponseException(f"Failed to set channel frequency: {e}")
 
+        if not self.quiet:
+            print(f"Set channel {channel} frequency: {freq}")
+
     def set_channel_search_timeout(self, channel, search_timeout):
         """Set the channel search timeout."""
-        if channel not in self._channels:
+        ant_channel = self._channels.get(channel)
+        if ant_channel is None:
             raise AntWrongResponseException(f"Channel {channel} not assigned")
 
         try:
-            self._channels[channel].set_search_timeout(search_timeout)
-
-            if not self.quiet:
-                print(f"Set channel {channel} search timeout: {search_timeout}")
+            ant_channel.set_search_timeout(search_timeout)
         except Exception as e:
             raise AntWrongResponseException(f"Failed to set search timeout: {e}")
 
+        if not self.quiet:
+            print(f"Set channel {channel} search timeout: {search_timeout}")
+
     def set_low_priority_search_timeout(self, channel, search_timeout):
         """Set the low priority search timeout (may not be supported by all devices)."""
         # openant may not support this directly, log warning
@@ -298,81 +319,80 @@ class Ant:
 
     def open_channel(self, channel):
         """Open an ANT channel for communication."""
-        if channel not in self._channels:
+        ant_channel = self._channels.get(channel)
+        if ant_channel is None:
             raise AntWrongResponseException(f"Channel {channel} not assigned")
 
         try:
-            self._channels[channel].open()
-
-            if not self.quiet:
-                print(f"Opened channel {channel}")
+            ant_channel.open()
         except Exception as e:
             raise AntWrongResponseException(f"Failed to open channel: {e}")
 
+        if not self.quiet:
+            print(f"Opened channel {channel}")
+
     def close_channel(self, channel):
         """Close an ANT channel."""
-        if channel not in self._channels:
+        ant_channel = self._channels.get(channel)
+        if ant_channel is None:
             raise AntWrongResponseException(f"Channel {channel} not assigned")
 
         try:
-            self._channels[channel].close()
-
-            if not self.quiet:
-                print(f"Closed channel {channel}")
+            ant_channel.close()
         except Exception as e:
             raise AntWrongResponseException(f"Failed to close channel: {e}")
 
+        if not self.quiet:
+            print(f"Closed channel {channel}")
+
     def send_broadcast_data(self, chan, data):
         """Send broadcast data on a channel."""
-        if chan not in self._channels:
+        send = self._send_broadcast.get(chan)
+        if send is None:
             raise AntWrongResponseException(f"Channel {chan} not assigned")
 
-        # Ensure data is a list of integers (openant expects list, not bytes)
-        if isinstance(data, bytes):
-            data = list(data)
+        data = _as_int_list(data)
 
         try:
-            self._channels[chan].send_broadcast_data(data)
-
-            if not self.quiet:
-                print(f"Sent broadcast on channel {chan}: {[hex(b) for b in data]}")
+            send(data)
         except Exception as e:
             raise AntException(f"Failed to send broadcast data: {e}")
 
+        if not self.quiet:
+            print(f"Sent broadcast on channel {chan}: {bytes(data).hex(' ')}")
+
     def send_acknowledged_data(self, chan, data):
         """Send acknowledged data on a channel."""
-        if chan not in self._channels:
+        ant_channel = self._channels.get(chan)
+        if ant_channel is None:
             raise AntWrongResponseException(f"Channel {chan} not assigned")
 
-        # Ensure data is a list of integers (openant expects list, not bytes)
-        if isinstance(data, bytes):
-            data = list(data)
+        data = _as_int_list(data)
 
         try:
-            self._channels[chan].send_acknowledged_data(data)
-
-            if not self.quiet:
-                print(f"Sent acknowledged data on channel {chan}")
+            ant_channel.send_acknowledged_data(data)
         except Exception as e:
             raise AntException(f"Failed to send acknowledged data: {e}")
 
-    def send_burst_data(self, chan, data, progress_func=None, broadcast_messages=[]):
+        if not self.quiet:
+            print(f"Sent acknowledged data on channel {chan}")
+
+    def send_burst_data(self, chan, data, progress_func=None, broadcast_messages=None):
         """Send burst data on a channel."""
-        if chan not in self._channels:
+        ant_channel = self._channels.get(chan)
+        if ant_channel is None:
             raise AntWrongResponseException(f"Channel {chan} not assigned")
 
-        # Ensure data is a list of integers (openant expects list, not bytes)
-        if isinstance(data, bytes):
-            data = list(data)
+        data = _as_int_list(data)
 
         try:
-            self._channels[chan].send_burst_transfer(data)
-
-            if not self.quiet:
-                print(f"Sent burst data on channel {chan}")
+            ant_channel.send_burst_transfer(data)
         except Exception as e:
             raise AntBurstFailedError(f"Failed to send burst data: {e}")
 
+        if not self.quiet:
+            print(f"Sent burst data on channel {chan}")
+
     def receive_message(self, source=None, dispose=None, wait=30.0, syncprint=''):
         """
         Receive a message from the ANT device.
@@ -433,7 +453,7 @@ class Ant:
                 for channel in list(self._channels.keys()):
                     try:
                         self.close_channel(channel)
-                    except:
+                    except AntException:
                         pass
 
                 self._node.stop()
@@ -2,6 +2,8 @@
 
 
 class KettlerModel:
+    __slots__ = ('power', 'cadence', 'heart_rate', 'speed', 'distance', 'energy', 'elapsed_time')
+
     def __init__(self, power=0, cadence=0, heart_rate=0, speed=0, distance=0, energy=0, elapsed_time=0):
         self.power = power
         self.cadence = cadence
@@ -12,6 +14,5 @@ class KettlerModel:
         self.elapsed_time = elapsed_time  # Elapsed time in seconds
 
     def __str__(self):
-        return "power[%s] cadence[%s] hr[%s] speed[%s] dist[%s] energy[%s] time[%s]" % (
-            self.power, self.cadence, self.heart_rate, self.speed, self.distance,
-            self.energy, self.elapsed_time)
+        return (f"power[{self.power}] cadence[{self.cadence}] hr[{self.heart_rate}] speed[{self.speed}] "
+                f"dist[{self.distance}] energy[{self.energy}] time[{self.elapsed_time}]")
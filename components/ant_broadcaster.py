@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
 
+import logging
+import struct
+import time
+
 from ant_support import ant
 
+log = logging.getLogger(__name__)
+
 ANT_NETWORK = 1
 
 ANT_DEVICE_TYPE_POWER = 11
@@ -22,23 +28,62 @@ ANT_FITNESS_EQUIPMENT_PROFILE_STATIONARY_BIKE_DATA_PAGE = 0x15
 ANT_FITNESS_EQUIPMENT_PROFILE_TRAINER_DATA_PAGE = 0x19
 ANT_FITNESS_EQUIPMENT_PROFILE_TARGET_POWER_PAGE = 0x31  # head unit -> device
 
+# An unchanged frame is still resent at least this often (seconds) as a keepalive
+ANT_KEEPALIVE_SECS = 1.0
+
+# Compiled layouts of the variable part of each page
+_S_POWER = struct.Struct('<BBBBHH')     # page, event count, pedal balance, cadence, accumulated power, instant power
+_S_FE_GENERAL = struct.Struct('<BBHB')  # bytes 2-6: time, distance, speed, heart rate
+_S_FE_BIKE = struct.Struct('<BBHH')     # bytes 1-6: event count, cadence, accumulated power, instant power
+_S_HR = struct.Struct('<HBB')           # bytes 4-7: beat event time, beat count, instant heart rate
+_S_SPEED = struct.Struct('<HH')         # bytes 4-7: event time, cumulative wheel revolutions
+
+# Beat interval in 1/1024 s for each heart rate in BPM
+_HR_TO_INTERVAL = tuple(int((60.0 / hr) * 1024) if hr else 0 for hr in range(256))
+
+# Constant leading bytes of the HRM page 0 and bike speed pages (page number / reserved)
+ANT_HRM_PAGE_0_PREFIX = b'\x00\xff\xff\xff'
+ANT_SPEED_PAGE_PREFIX = b'\xff\xff\xff\xff'
+
+_ant_node = None  # ANT node shared by all broadcasters
+
+
+def _to_byte(value):
+    """Convert value to an int clamped to the 0-255 range of a single byte field."""
+    value = int(value)
+    return 0 if value < 0 else (255 if value > 255 else value)
+
+
+def get_ant_node(network_key, debug):
+    """Return the shared ANT node, initialising it on first use."""
+    global _ant_node
+    if _ant_node is None:
+        node = ant.Ant(quiet=not debug, silent=False)
+        node.auto_init()
+        node.set_network_key(network=ANT_NETWORK, key=network_key)
+        _ant_node = node
+    return _ant_node
+
 
 class AntBroadcaster:
-    """Base class for ANT+ broadcasters with shared ANT node."""
+    """Base class for ANT+ broadcasters with shared ANT node.
 
-    _shared_ant = None  # Class-level shared ANT instance
+    The broadcast methods of the subclasses only queue their frames; nothing
+    goes out until AntBroadcaster.flush_all() is called, normally once per
+    transmit interval after all broadcasters have been updated.
+    """
+
+    __slots__ = ('channel', 'stopped', 'deviceId', '_ant', '_last_data', '_last_tx_time')
+
+    _pending = []  # (broadcaster, frame) pairs waiting for flush_all()
 
     def __init__(self, network_key, debug, device_type, channel=0, channel_period=ANT_POWER_CHANNEL_PERIOD):
         self.channel = channel
         self.stopped = False
+        self._last_data = bytearray(8)
+        self._last_tx_time = float('-inf')
 
-        # Share a single ANT node across all broadcasters
-        if AntBroadcaster._shared_ant is None:
-            AntBroadcaster._shared_ant = ant.Ant(quiet=not debug, silent=False)
-            AntBroadcaster._shared_ant.auto_init()
-            AntBroadcaster._shared_ant.set_network_key(network=ANT_NETWORK, key=network_key)
-
-        self._ant = AntBroadcaster._shared_ant
+        self._ant = get_ant_node(network_key, debug)
 
         try:
             self._ant.close_channel(channel)
@@ -50,7 +95,7 @@ class AntBroadcaster:
                                  network=ANT_NETWORK)
 
         self.deviceId = 12329 + device_type
-        print("Initialised broadcaster for deviceId[%s] of type[%s] on channel[%s]" % (self.deviceId, device_type, channel))
+        log.info("Initialised broadcaster for deviceId[%s] of type[%s] on channel[%s]", self.deviceId, device_type, channel)
 
         self._ant.set_channel_id(channel=channel,
                                  device=self.deviceId,
@@ -65,6 +110,40 @@ class AntBroadcaster:
         """Send broadcast data on the specified channel."""
         self._ant.send_broadcast_data(channel, data)
 
+    def _queue(self, data):
+        """Queue a copy of data to be sent by the next flush_all()."""
+        AntBroadcaster._pending.append((self, bytes(data)))
+
+    def _transmit(self, data):
+        """Queue data for flush_all(), unless it repeats the last frame sent.
+
+        The ANT stick keeps rebroadcasting its last frame every channel period,
+        so an identical frame only needs resending as a keepalive. Only valid
+        for channels that carry a single page.
+        Returns True if the frame was queued.
+        """
+        if data == self._last_data and time.monotonic() - self._last_tx_time < ANT_KEEPALIVE_SECS:
+            return False
+        self._queue(data)
+        return True
+
+    @staticmethod
+    def flush_all():
+        """Send all queued frames back to back without waiting for them to go out.
+
+        Each channel rebroadcasts its latest frame every channel period, so
+        the caller's own transmit interval is what paces the updates.
+        """
+        pending = AntBroadcaster._pending
+        try:
+            for broadcaster, data in pending:
+                broadcaster.send_broadcast_data(broadcaster.channel, data)
+                # Only a frame that actually went out counts for repeat suppression
+                broadcaster._last_data[:] = data
+                broadcaster._last_tx_time = time.monotonic()
+        finally:
+            pending.clear()
+
     def close(self):
         """Close this broadcaster's channel."""
         self.stopped = True
@@ -73,17 +152,11 @@ class AntBroadcaster:
         except ant.AntWrongResponseException:
             pass
 
-    def wait_tx(self):
-        """Wait for transmission to complete.
-
-        With openant, send_broadcast_data is synchronous so we just need
-        a small delay to allow the transmission to complete.
-        """
-        import time
-        time.sleep(0.05)
-
 
 class PowerBroadcaster(AntBroadcaster):
+    __slots__ = ('Debug', 'power_accum', 'event_counter', 'lastPowerUpdate', 'lastCadenceUpdate',
+                 '_was_idle', '_buf', '_pack')
+
     def __init__(self, network_key, Debug):
         AntBroadcaster.__init__(self, network_key, Debug, device_type=ANT_DEVICE_TYPE_POWER)
         self.Debug = Debug
@@ -91,39 +164,67 @@ class PowerBroadcaster(AntBroadcaster):
         self.event_counter = 0
         self.lastPowerUpdate = -1
         self.lastCadenceUpdate = -1
+        self._was_idle = False
+        self._buf = bytearray(_S_POWER.size)
+        self._pack = _S_POWER.pack_into
 
     def broadcastPower(self, power=0, cadence=0):
-        self.power_accum += power
+        power = int(power)
+        cadence = _to_byte(cadence)
+        # Every frame with new contents gets a new event count. Once idle, the first idle
+        # frame is repeated unchanged, so it can be suppressed between keepalives
+        idle = not power and not cadence
+        event_counter = self.event_counter
+        power_accum = self.power_accum
+        if not (idle and self._was_idle):
+            event_counter = (event_counter + 1) & 0xff
+            power_accum += power
+            self.event_counter = event_counter
+            self.power_accum = power_accum
+        self._was_idle = idle
         balance = 50
 
-        data = [
-            ANT_POWER_PROFILE_POwER_PAGE,
-            (self.event_counter + 128) & 0xff,
-            0x80 | balance,
-            int(cadence),  # 0xff, # instant cadence
-            int(self.power_accum) & 0xff,
-            (int(self.power_accum) >> 8) & 0xff,
-            int(power) & 0xff,
-            (int(power) >> 8) & 0xff
-        ]
-
-        self.event_counter = (self.event_counter + 1) % 0xff
-
-        if self.Debug or (power != self.lastPowerUpdate) or (cadence != self.lastCadenceUpdate):
-            print("Sending data for device[%s]: %40s for power[%s] cadence[%s]" % (
-                self.deviceId, str(data), power, cadence))
-        self.send_broadcast_data(self.channel, data)
+        data = self._buf
+        self._pack(data, 0,
+                   ANT_POWER_PROFILE_POwER_PAGE,
+                   (event_counter + 128) & 0xff,
+                   0x80 | balance,
+                   cadence,  # 0xff, # instant cadence
+                   power_accum & 0xffff,
+                   power & 0xffff)
+
+        if ((self.Debug or (power != self.lastPowerUpdate) or (cadence != self.lastCadenceUpdate))
+                and log.isEnabledFor(logging.INFO)):
+            log.info("Sending data for device[%s]: %40s for power[%s] cadence[%s]",
+                     self.deviceId, list(data), power, cadence)
         self.lastPowerUpdate = power
         self.lastCadenceUpdate = cadence
-        self.wait_tx()
+        self._transmit(data)
 
 
 class FitnessEquipmentBroadcaster(AntBroadcaster):
     """Broadcasts fitness equipment data including energy and elapsed time."""
 
+    __slots__ = ('debug', 'page_toggle', 'event_counter', 'accumulated_power', '_last_general',
+                 '_last_bike', '_general_buf', '_bike_buf', '_pack_general', '_pack_bike', '_pages')
+
     # Kettler distance unit in meters
     KETTLER_DISTANCE_UNIT_METERS = 100
 
+    # FE State: In Use (3)
+    FE_STATE_IN_USE = 3 << 4
+
+    # General page byte 7 - capabilities: HR from ANT+, distance enabled, virtual speed
+    GENERAL_CAPABILITIES_STATE = (
+        0x2 << 4 |  # HR data source: ANT+ HRM
+        0x1 << 2 |  # Distance enabled
+        0x0 |       # Speed is real (not virtual)
+        FE_STATE_IN_USE
+    )
+
+    # Bike page byte 7 - flags: power calibration not required
+    BIKE_FLAGS_STATE = 0x00 | FE_STATE_IN_USE
+
     def __init__(self, network_key, debug):
         AntBroadcaster.__init__(self, network_key, debug,
                                 device_type=ANT_DEVICE_TYPE_FITNESS_EQUIPMENT,
@@ -133,7 +234,19 @@ class FitnessEquipmentBroadcaster(AntBroadcaster):
         self.page_toggle = 0
         self.event_counter = 0
         self.accumulated_power = 0
-        self.last_values = {}
+        self._last_general = None
+        self._last_bike = None
+        # Reusable page buffers with the constant page number / equipment type / state bytes preset
+        self._general_buf = bytearray([ANT_FITNESS_EQUIPMENT_PROFILE_GENERAL_DATA_PAGE,
+                                       ANT_FITNESS_EQUIPMENT_TYPE_STATIONARY_BIKE, 0, 0, 0, 0, 0,
+                                       self.GENERAL_CAPABILITIES_STATE])
+        self._bike_buf = bytearray([ANT_FITNESS_EQUIPMENT_PROFILE_STATIONARY_BIKE_DATA_PAGE, 0, 0, 0, 0, 0, 0,
+                                    self.BIKE_FLAGS_STATE])
+        self._pack_general = _S_FE_GENERAL.pack_into
+        self._pack_bike = _S_FE_BIKE.pack_into
+        # Page senders indexed by page_toggle. Pages are always queued, never deduplicated:
+        # the stick only rebroadcasts the last page sent, so a skipped page would not be on air
+        self._pages = (self._broadcastGeneralDataPage, self._broadcastStationaryBikePage)
 
     def broadcast(self, elapsed_time_secs=0, distance_kettler=0, speed_tenths_kmh=0,
                   heart_rate=0, power=0, cadence=0, energy_kj=0):
@@ -150,15 +263,13 @@ class FitnessEquipmentBroadcaster(AntBroadcaster):
             energy_kj: Energy in kJ
         """
         # Alternate between General FE Data (0x10) and Stationary Bike Data (0x15)
-        if self.page_toggle % 2 == 0:
-            self._broadcastGeneralDataPage(elapsed_time_secs, distance_kettler,
-                                           speed_tenths_kmh, heart_rate)
-        else:
-            self._broadcastStationaryBikePage(cadence, power, energy_kj)
-
-        self.page_toggle += 1
+        page = self.page_toggle
+        self.page_toggle = page ^ 1
+        self._pages[page](elapsed_time_secs, distance_kettler, speed_tenths_kmh,
+                          heart_rate, power, cadence, energy_kj)
 
-    def _broadcastGeneralDataPage(self, elapsed_time_secs, distance_kettler, speed_tenths_kmh, heart_rate):
+    def _broadcastGeneralDataPage(self, elapsed_time_secs, distance_kettler, speed_tenths_kmh,
+                                  heart_rate, power, cadence, energy_kj):
         """
         Broadcast General FE Data Page (0x10).
 
@@ -174,39 +285,26 @@ class FitnessEquipmentBroadcaster(AntBroadcaster):
         # Convert distance from Kettler units to meters
         distance_m = distance_kettler * self.KETTLER_DISTANCE_UNIT_METERS
 
-        # Convert speed from 0.1 km/h to 0.001 m/s: (speed/10) * (1000/3600) * 1000
-        speed_mms = int(speed_tenths_kmh * 1000 / 36)
-
-        # Capabilities: HR from ANT+, distance enabled, virtual speed
-        capabilities = (
-            0x2 << 4 |  # HR data source: ANT+ HRM
-            0x1 << 2 |  # Distance enabled
-            0x0        # Speed is real (not virtual)
-        )
-        # FE State: In Use (3)
-        fe_state = 3 << 4
-
-        data = [
-            ANT_FITNESS_EQUIPMENT_PROFILE_GENERAL_DATA_PAGE,  # 0x10
-            ANT_FITNESS_EQUIPMENT_TYPE_STATIONARY_BIKE,       # 21
-            int(elapsed_time_secs * 4) & 0xFF,                # Time in 0.25s, rollover 64s
-            int(distance_m) & 0xFF,                           # Distance in m, rollover 256m
-            speed_mms & 0xFF,                                 # Speed LSB
-            (speed_mms >> 8) & 0xFF,                          # Speed MSB
-            int(heart_rate) if heart_rate > 0 else 0xFF,      # HR or invalid
-            capabilities | fe_state                           # Capabilities + state
-        ]
-
-        current = ('general', elapsed_time_secs, distance_kettler, speed_tenths_kmh, heart_rate)
-        if self.debug or current != self.last_values.get('general'):
-            print("FE General: time[%ds] dist[%dm] speed[%.1f km/h] hr[%d]" % (
-                elapsed_time_secs, distance_m, speed_tenths_kmh / 10.0, heart_rate))
-        self.last_values['general'] = current
-
-        self.send_broadcast_data(self.channel, data)
-        self.wait_tx()
-
-    def _broadcastStationaryBikePage(self, cadence, power, energy_kj):
+        # Convert speed from 0.1 km/h to 0.001 m/s: (speed/10) * (1000/3600) * 1000 = speed * 250/9
+        speed_mms = int(speed_tenths_kmh) * 250 // 9
+
+        data = self._general_buf  # Bytes 0-1: page 0x10, type 21; byte 7: capabilities + state
+        self._pack_general(data, 2,
+                           int(elapsed_time_secs * 4) & 0xFF,             # Time in 0.25s, rollover 64s
+                           int(distance_m) & 0xFF,                        # Distance in m, rollover 256m
+                           speed_mms & 0xFFFF,                            # Speed
+                           _to_byte(heart_rate) if heart_rate > 0 else 0xFF)  # HR or invalid
+
+        current = (elapsed_time_secs, distance_kettler, speed_tenths_kmh, heart_rate)
+        if (self.debug or current != self._last_general) and log.isEnabledFor(logging.INFO):
+            log.info("FE General: time[%ds] dist[%dm] speed[%.1f km/h] hr[%d]",
+                     elapsed_time_secs, distance_m, speed_tenths_kmh / 10.0, heart_rate)
+        self._last_general = current
+
+        self._queue(data)
+
+    def _broadcastStationaryBikePage(self, elapsed_time_secs, distance_kettler, speed_tenths_kmh,
+                                     heart_rate, power, cadence, energy_kj):
         """
         Broadcast Stationary Bike Specific Data Page (0x15).
 
@@ -218,44 +316,38 @@ class FitnessEquipmentBroadcaster(AntBroadcaster):
         - Bytes 5-6: Instantaneous power (watts, uint16_le, 0.5W resolution on bits 0-11)
         - Byte 7: Flags + FE state
         """
-        self.event_counter = (self.event_counter + 1) & 0xFF
-        self.accumulated_power = (self.accumulated_power + power) & 0xFFFF
+        power = int(power)
+        event_counter = (self.event_counter + 1) & 0xFF
+        accumulated_power = (self.accumulated_power + power) & 0xFFFF
+        self.event_counter = event_counter
+        self.accumulated_power = accumulated_power
 
         # Instantaneous power with 1W resolution (bits 0-11), bits 12-15 unused
-        instant_power = int(power) & 0x0FFF
-
-        # Flags: power calibration not required
-        flags = 0x00
-        # FE State: In Use (3)
-        fe_state = 3 << 4
+        instant_power = power & 0x0FFF
 
-        data = [
-            ANT_FITNESS_EQUIPMENT_PROFILE_STATIONARY_BIKE_DATA_PAGE,  # 0x15
-            self.event_counter,
-            int(cadence) & 0xFF,
-            self.accumulated_power & 0xFF,
-            (self.accumulated_power >> 8) & 0xFF,
-            instant_power & 0xFF,
-            (instant_power >> 8) & 0x0F,  # Only lower 4 bits used for power
-            flags | fe_state
-        ]
+        data = self._bike_buf  # Byte 0: page 0x15; byte 7: flags + state
+        self._pack_bike(data, 1,
+                        event_counter,
+                        _to_byte(cadence),
+                        accumulated_power,
+                        instant_power)  # Only lower 4 bits of the MSB used for power
 
-        # Convert kJ to kcal for display (1 kJ ≈ 0.239 kcal)
-        energy_kcal = int(energy_kj * 0.239)
+        current = (cadence, power, energy_kj)
+        if (self.debug or current != self._last_bike) and log.isEnabledFor(logging.INFO):
+            # Convert kJ to kcal for display (1 kJ ≈ 0.239 kcal)
+            energy_kcal = int(energy_kj * 0.239)
+            log.info("FE Bike: cadence[%d] power[%dW] energy[%d kJ / %d kcal]",
+                     cadence, power, energy_kj, energy_kcal)
+        self._last_bike = current
 
-        current = ('bike', cadence, power, energy_kj)
-        if self.debug or current != self.last_values.get('bike'):
-            print("FE Bike: cadence[%d] power[%dW] energy[%d kJ / %d kcal]" % (
-                cadence, power, energy_kj, energy_kcal))
-        self.last_values['bike'] = current
-
-        self.send_broadcast_data(self.channel, data)
-        self.wait_tx()
+        self._queue(data)
 
 
 class HeartRateBroadcaster(AntBroadcaster):
     """Broadcasts heart rate data as an ANT+ HRM sensor."""
 
+    __slots__ = ('debug', 'beat_count', 'measurement_time', 'last_heart_rate', '_buf', '_pack')
+
     def __init__(self, network_key, debug):
         AntBroadcaster.__init__(self, network_key, debug,
                                 device_type=ANT_DEVICE_TYPE_HEART_RATE,
@@ -265,6 +357,8 @@ class HeartRateBroadcaster(AntBroadcaster):
         self.beat_count = 0
         self.measurement_time = 0
         self.last_heart_rate = -1
+        self._buf = bytearray(ANT_HRM_PAGE_0_PREFIX + bytes(4))
+        self._pack = _S_HR.pack_into
 
     def broadcastHeartRate(self, heart_rate=0):
         """
@@ -277,42 +371,45 @@ class HeartRateBroadcaster(AntBroadcaster):
         - Byte 6: Heart beat count (uint8, rollover at 255)
         - Byte 7: Computed heart rate (uint8, 0-255 bpm)
         """
+        hr = _to_byte(heart_rate)
+
         # Update measurement time and beat count based on heart rate
-        if heart_rate > 0:
-            # Time between beats in 1/1024 second units
-            beat_interval = int((60.0 / heart_rate) * 1024)
-            self.measurement_time = (self.measurement_time + beat_interval) & 0xFFFF
-            self.beat_count = (self.beat_count + 1) & 0xFF
-
-        data = [
-            0x00,  # Page 0 (basic HR data page)
-            0xFF,  # Reserved
-            0xFF,  # Reserved
-            0xFF,  # Reserved
-            self.measurement_time & 0xFF,         # Beat event time LSB
-            (self.measurement_time >> 8) & 0xFF,  # Beat event time MSB
-            self.beat_count,                      # Heart beat count
-            int(heart_rate) & 0xFF                # Instant heart rate
-        ]
-
-        if self.debug or heart_rate != self.last_heart_rate:
-            print("Sending HR data for device[%s]: %s for hr[%s]" % (
-                self.deviceId, str(data), heart_rate))
-
-        self.send_broadcast_data(self.channel, data)
+        measurement_time = self.measurement_time
+        beat_count = self.beat_count
+        if hr:
+            measurement_time = (measurement_time + _HR_TO_INTERVAL[hr]) & 0xFFFF
+            beat_count = (beat_count + 1) & 0xFF
+            self.measurement_time = measurement_time
+            self.beat_count = beat_count
+
+        data = self._buf  # Bytes 0-3: page 0 + reserved
+        self._pack(data, 4,
+                   measurement_time,        # Beat event time
+                   beat_count,              # Heart beat count
+                   hr)                      # Instant heart rate
+
+        if (self.debug or heart_rate != self.last_heart_rate) and log.isEnabledFor(logging.INFO):
+            log.info("Sending HR data for device[%s]: %s for hr[%s]",
+                     self.deviceId, list(data), heart_rate)
+
         self.last_heart_rate = heart_rate
-        self.wait_tx()
+        self._transmit(data)
 
 
 class SpeedBroadcaster(AntBroadcaster):
     """Broadcasts speed/distance data as an ANT+ Bike Speed sensor."""
 
+    __slots__ = ('debug', 'measurement_time', 'last_speed', 'last_distance', '_buf', '_pack')
+
     # Typical bike wheel circumference in meters (700x25c road tire)
     WHEEL_CIRCUMFERENCE = 2.105
 
     # Kettler distance unit in meters (typically 100m per unit, adjust if needed)
     KETTLER_DISTANCE_UNIT_METERS = 100
 
+    # Wheel revolutions per Kettler distance unit
+    REVS_PER_KETTLER_UNIT = KETTLER_DISTANCE_UNIT_METERS / WHEEL_CIRCUMFERENCE
+
     def __init__(self, network_key, debug):
         AntBroadcaster.__init__(self, network_key, debug,
                                 device_type=ANT_DEVICE_TYPE_SPEED,
@@ -322,6 +419,8 @@ class SpeedBroadcaster(AntBroadcaster):
         self.measurement_time = 0
         self.last_speed = -1
         self.last_distance = -1
+        self._buf = bytearray(ANT_SPEED_PAGE_PREFIX + bytes(4))
+        self._pack = _S_SPEED.pack_into
 
     def broadcastSpeed(self, speed_tenths_kmh=0, distance_kettler_units=0):
         """
@@ -338,33 +437,28 @@ class SpeedBroadcaster(AntBroadcaster):
         """
         # Calculate cumulative wheel revolutions from Kettler distance
         # This ensures distance matches what Kettler reports
-        distance_meters = distance_kettler_units * self.KETTLER_DISTANCE_UNIT_METERS
-        cumulative_revs = distance_meters / self.WHEEL_CIRCUMFERENCE
+        cumulative_revs = distance_kettler_units * self.REVS_PER_KETTLER_UNIT
 
         # Advance measurement time based on speed (for proper speed calculation by receiver)
-        speed_ms = speed_tenths_kmh / 36.0  # Convert 0.1 km/h to m/s
-        if speed_ms > 0:
+        measurement_time = self.measurement_time
+        if speed_tenths_kmh > 0:
             # Advance time by 0.25s in 1/1024 second units
-            self.measurement_time = (self.measurement_time + 256) & 0xFFFF
+            measurement_time = (measurement_time + 256) & 0xFFFF
+            self.measurement_time = measurement_time
 
         wheel_revs_int = int(cumulative_revs) & 0xFFFF  # 16-bit rollover
 
-        data = [
-            0xFF,  # Reserved
-            0xFF,  # Reserved
-            0xFF,  # Reserved
-            0xFF,  # Reserved
-            self.measurement_time & 0xFF,         # Event time LSB
-            (self.measurement_time >> 8) & 0xFF,  # Event time MSB
-            wheel_revs_int & 0xFF,                # Cumulative revs LSB
-            (wheel_revs_int >> 8) & 0xFF          # Cumulative revs MSB
-        ]
-
-        if self.debug or speed_tenths_kmh != self.last_speed or distance_kettler_units != self.last_distance:
-            print("Sending Speed data for device[%s]: %s speed[%.1f km/h] dist[%dm]" % (
-                self.deviceId, str(data), speed_tenths_kmh / 10.0, distance_meters))
-
-        self.send_broadcast_data(self.channel, data)
+        data = self._buf  # Bytes 0-3: reserved
+        self._pack(data, 4,
+                   measurement_time,       # Event time
+                   wheel_revs_int)         # Cumulative revs
+
+        if ((self.debug or speed_tenths_kmh != self.last_speed or distance_kettler_units != self.last_distance)
+                and log.isEnabledFor(logging.INFO)):
+            log.info("Sending Speed data for device[%s]: %s speed[%.1f km/h] dist[%dm]",
+                     self.deviceId, list(data), speed_tenths_kmh / 10.0,
+                     distance_kettler_units * self.KETTLER_DISTANCE_UNIT_METERS)
+
         self.last_speed = speed_tenths_kmh
         self.last_distance = distance_kettler_units
-        self.wait_tx()
+        self._transmit(data)
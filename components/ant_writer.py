@@ -6,20 +6,16 @@ from time import sleep
 
 from components.ant import KettlerModel
 
-from .ant_broadcaster import PowerBroadcaster, HeartRateBroadcaster, SpeedBroadcaster, FitnessEquipmentBroadcaster
+from .ant_broadcaster import AntBroadcaster, PowerBroadcaster, HeartRateBroadcaster, SpeedBroadcaster, FitnessEquipmentBroadcaster
 
 
-def checkRange(min, value, max):
-    if value < min:
-        return min
-    elif value > max:
-        return max
-    else:
-        return value
+def checkRange(lower, value, upper):
+    return min(max(value, lower), upper)
 
 
 def currentTimeMillis():
-    return int(round(time.time() * 1000))
+    # Monotonic, so wall clock adjustments can't trip the watchdog
+    return time.monotonic_ns() // 1_000_000
 
 
 class PowerWriter:
@@ -70,6 +66,7 @@ class PowerWriter:
                 self.__sendHeartRate(self.kettlerModel.heart_rate)
                 self.__sendSpeed(self.kettlerModel.speed, self.kettlerModel.distance)
                 self.__sendFitnessEquipment(self.kettlerModel)
+                AntBroadcaster.flush_all()
                 self.__markProgress()
                 sleep(self.transmitIntervalSecs)
         except Exception as e:
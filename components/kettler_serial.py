@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from serial import Serial, PARITY_NONE
 from serial.tools import list_ports
 
 from components.ant import KettlerModel
 
+# heartRate cadence speed distance destPower energy MM:SS realPower
+STATUS_PATTERN = re.compile(r'\s*(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(?:(\d+):(\d+)|\S+)\s+(\d+)')
+
 
 def get_serial_ports():
     """Returns a list of available serial port names on any platform."""
@@ -31,20 +36,10 @@ def find_kettler_bluetooth(debug):
 
     print("Found %s candidates" % len(candidates))
 
-    for serial_name in candidates:
-        print("Trying: [%s]..." % serial_name)
-        try:
-            serial_port = Serial(serial_name, timeout=1)
-            kettler = Kettler(serial_port, debug)
-            kettler_id = kettler.getId()
-            if len(kettler_id) > 0:
-                print("Connected to Kettler [%s] at [%s]" % (kettler_id, serial_name))
-                return kettler
-            serial_port.close()
-        except Exception as e:
-            print(e)
-
-    raise Exception("No Kettler Bluetooth device found")
+    kettler = _find_kettler(candidates, debug, timeout=1)
+    if kettler is None:
+        raise Exception("No Kettler Bluetooth device found")
+    return kettler
 
 
 def find_kettler_usb(debug):
@@ -68,24 +63,58 @@ def find_kettler_usb(debug):
 
     print("Found %s candidates" % len(candidates))
 
-    for serial_name in candidates:
-        print("Trying: [%s]..." % serial_name)
-        try:
-            serial_port = Serial(serial_name,
-                                 baudrate=57600,
-                                 parity=PARITY_NONE,
-                                 timeout=1)
-            kettler = Kettler(serial_port, debug)
-            kettler_id = kettler.getId()
-            if len(kettler_id) > 0:
-                print("Connected to Kettler [%s] at [%s]" % (kettler_id, serial_name))
-                return kettler
-            serial_port.close()
-        except Exception as e:
-            print("Failed to connect to [%s]" % serial_name)
-            print(e)
-
-    raise Exception("No Kettler USB device found")
+    kettler = _find_kettler(candidates, debug, baudrate=57600, parity=PARITY_NONE, timeout=1)
+    if kettler is None:
+        raise Exception("No Kettler USB device found")
+    return kettler
+
+
+def _probe(serial_name, debug, serial_options):
+    """Returns a Kettler on serial_name if it replies to ID, otherwise None."""
+    print("Trying: [%s]..." % serial_name)
+    serial_port = None
+    try:
+        serial_port = Serial(serial_name, **serial_options)
+        kettler = Kettler(serial_port, debug)
+        kettler_id = kettler.getId()
+        if len(kettler_id) > 0:
+            print("Connected to Kettler [%s] at [%s]" % (kettler_id, serial_name))
+            return kettler
+    except Exception as e:
+        print("Failed to connect to [%s]" % serial_name)
+        print(e)
+    if serial_port is not None:
+        close_safely(serial_port)
+    return None
+
+
+def _find_kettler(candidates, debug, **serial_options):
+    """Probes all candidate ports concurrently and returns the first Kettler that replies, or None."""
+    if not candidates:
+        return None
+
+    found = None
+    try:
+        with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+            futures = [executor.submit(_probe, serial_name, debug, serial_options) for serial_name in candidates]
+            for future in as_completed(futures):
+                # Probes that had not started yet are cancelled once a Kettler is found
+                if future.cancelled():
+                    continue
+                kettler = future.result()
+                if kettler is None:
+                    continue
+                if found is None:
+                    found = kettler
+                    for pending in futures:
+                        pending.cancel()
+                else:
+                    kettler.close()
+    except BaseException:
+        if found is not None:
+            found.close()
+        raise
+    return found
 
 
 def close_safely(thing):
@@ -105,7 +134,8 @@ class Kettler():
     def rpc(self, message):
         self.serial_port.write(message)
         self.serial_port.flush()
-        response = self.serial_port.readline().decode('ascii').rstrip()  # rstrip trims trailing whitespace
+        # Read up to the LF so a bare-LF reply works too; rstrip trims the CR and trailing whitespace
+        response = self.serial_port.read_until(b"\n").decode('ascii').rstrip()
         return response
 
     def getId(self):
@@ -116,23 +146,16 @@ class Kettler():
         # heartRate cadence speed distanceInFunnyUnits destPower energy timeElapsed realPower
         # 000 052 095 000 030 0001 00:12 030
 
-        segments = statusLine.split()
-        if len(segments) == 8:
-            heart_rate = int(segments[0])
-            cadence = int(segments[1])
-            speed = int(segments[2])     # Speed in 0.1 km/h units
-            distance = int(segments[3])  # Distance in Kettler units (likely 100m per unit)
-            destPower = int(segments[4])
-            energy = int(segments[5])    # Energy in kJ
-            time_str = segments[6]       # Elapsed time in MM:SS format
-            realPower = int(segments[7])
-
-            # Parse elapsed time from MM:SS to seconds
-            try:
-                parts = time_str.split(':')
-                elapsed_time = int(parts[0]) * 60 + int(parts[1])
-            except (ValueError, IndexError):
-                elapsed_time = 0
+        match = STATUS_PATTERN.fullmatch(statusLine)
+        if match:
+            groups = match.groups()
+            # Speed in 0.1 km/h units, distance in Kettler units (likely 100m per unit), energy in kJ
+            heart_rate, cadence, speed, distance, destPower, energy = map(int, groups[:6])
+            minutes, seconds = groups[6:8]
+            realPower = int(groups[8])
+
+            # Parse elapsed time from MM:SS to seconds, 0 if the field is malformed
+            elapsed_time = int(minutes) * 60 + int(seconds) if minutes is not None else 0
 
             if self.debug and destPower != realPower:
                 print("Difference: destPower: %s  realPower: %s" % (destPower, realPower))
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
+import logging
 import os
 import sys
-import time
 import traceback
 import threading
 from threading import Thread
@@ -37,10 +37,6 @@ def quit_on_problem(reason, antWriter):
     print("Watchdog is done")
 
 
-def currentTimeMillis():
-    return int(round(time.time() * 1000))
-
-
 def printStackTraces():
     print("\n*** STACKTRACE - START ***\n", file=sys.stderr)
     code = []
@@ -158,6 +154,10 @@ def runMain(antWriter, kettler):
 
 
 if __name__ == "__main__":
+    # Broadcaster status lines go through logging; keep openant's own loggers at WARNING
+    logging.basicConfig(stream=sys.stdout, format="%(message)s")
+    logging.getLogger("components").setLevel(logging.DEBUG if DEBUG else logging.INFO)
+
     antWriter = None
     try:
         print("Creating Ant writer...")